@@ -16,6 +16,7 @@ __credits__ = ['Max Harrison']
 # source code: https://github.com/Cornelius-Figgle/noughts-crosses-qt6
 
 
+import argparse
 import sys
 from collections.abc import Callable
 from typing import Any
@@ -42,7 +43,11 @@ class GUI_Interface(QMainWindow):
     information from, the user in a consistant and modular way. 
     '''
 
-    def __init__(self, _AppObj: type[QApplication]) -> None:
+    def __init__(
+            self,
+            _AppObj: type[QApplication],
+            gametype: str = 'cpu'
+        ) -> None:
         '''
         Sets up the gui and handles the main program loop after exec is
         handed over.
@@ -53,7 +58,7 @@ class GUI_Interface(QMainWindow):
 
         # initialise object
         self.GameObj = Game(self)
-        self.GameObj.setup_game(gametype='cpu')
+        self.GameObj.setup_game(gametype=gametype)
 
         # stores the QApplication object for later use in `_quit()`
         self.AppObj = _AppObj
@@ -189,37 +194,19 @@ class GUI_Interface(QMainWindow):
         self.board_layout = QGridLayout()
 
         # add tiles to the board, using `Game.board`
-        for x in range(len(self.GameObj.board[0])):
-            for y in range(len(self.GameObj.board)):
-                # use a clickable `QLabel` for each tile
-                # since we can set `QFrame` styling options on `QLabel`s
-                # which you can't do on a `QPushButton`
-                psuedo_button = QLabel()
-                match self.GameObj.board[y][x]:
-                    case 0:
-                        psuedo_button.setPixmap(
-                            qta.icon('msc.blank').pixmap(QSize(128,128))
-                        )
-                    case 1:
-                        psuedo_button.setPixmap(
-                            qta.icon('msc.circle-large').pixmap(QSize(128,128))
+        match self.GameObj.current_gametype:
+            case 'ult':
+                self.draw_ultimate_board()
+            case '3d':
+                self.draw_qubic_board()
+            case _:
+                for x in range(len(self.GameObj.board[0])):
+                    for y in range(len(self.GameObj.board)):
+                        self.board_layout.addWidget(
+                            self.draw_tile(self.GameObj.board[y][x], (x,y)),
+                            y,
+                            x
                         )
-                    case 2:
-                        psuedo_button.setPixmap(
-                            qta.icon('msc.chrome-close').pixmap(QSize(128,128))
-                        )
-
-                # sets options for our 'button'
-                psuedo_button.setFrameStyle(
-                    QFrame.Shape.Panel | QFrame.Shadow.Raised
-                )
-                psuedo_button.setLineWidth(4)
-                psuedo_button.setScaledContents(True)
-                psuedo_button.mousePressEvent = lambda event, pos=(x,y): \
-                    self._event(self.GameObj.take_turn, [pos])
-
-                # add the tile to the board layout
-                self.board_layout.addWidget(psuedo_button,y,x)
 
         # set the layout containing the tiles onto the board widget
         self.board_widget.setLayout(self.board_layout)
@@ -241,6 +228,133 @@ class GUI_Interface(QMainWindow):
 
         return
 
+    def draw_tile(
+            self,
+            player: int,
+            pos: tuple[int,int] | None = None,
+            size: int = 128
+        ) -> QLabel:
+        '''
+        Creates a tile showing `player`'s symbol, which takes a turn at
+        `pos` when clicked (if given).
+        '''
+
+        # use a clickable `QLabel` for each tile
+        # since we can set `QFrame` styling options on `QLabel`s
+        # which you can't do on a `QPushButton`
+        psuedo_button = QLabel()
+        match player:
+            case 0:
+                psuedo_button.setPixmap(
+                    qta.icon('msc.blank').pixmap(QSize(size,size))
+                )
+            case 1:
+                psuedo_button.setPixmap(
+                    qta.icon('msc.circle-large').pixmap(QSize(size,size))
+                )
+            case 2:
+                psuedo_button.setPixmap(
+                    qta.icon('msc.chrome-close').pixmap(QSize(size,size))
+                )
+
+        # sets options for our 'button'
+        psuedo_button.setFrameStyle(
+            QFrame.Shape.Panel | QFrame.Shadow.Raised
+        )
+        psuedo_button.setLineWidth(4 if size >= 128 else 2)
+        psuedo_button.setScaledContents(True)
+        if pos is not None:
+            psuedo_button.mousePressEvent = lambda event, pos=pos: \
+                self._event(self.GameObj.take_turn, [pos])
+
+        return psuedo_button
+
+    def draw_ultimate_board(self) -> None:
+        '''
+        Draws the sub-boards of an Ultimate Noughts & Crosses board
+        into the board's layout.
+        '''
+
+        for sx in range(3):
+            for sy in range(3):
+                # create a frame to hold the sub-board
+                sub_widget = QFrame()
+                sub_layout = QGridLayout()
+
+                winner = self.GameObj.board.sub_owner((sx,sy))
+                if winner:
+                    # won sub-boards are shown as one large tile
+                    sub_layout.addWidget(self.draw_tile(winner), 0, 0)
+                else:
+                    # add the tiles of the sub-board, using their
+                    # position on the full 9x9 grid
+                    for x in range(3):
+                        for y in range(3):
+                            pos = (sx*3 + x, sy*3 + y)
+                            sub_layout.addWidget(
+                                self.draw_tile(
+                                    self.GameObj.board.cell(pos),
+                                    pos,
+                                    40
+                                ),
+                                y,
+                                x
+                            )
+
+                sub_widget.setLayout(sub_layout)
+
+                # raise the sub-boards that can be played in next
+                if self.GameObj.board.is_active((sx,sy)):
+                    sub_widget.setFrameStyle(
+                        QFrame.Shape.Panel | QFrame.Shadow.Raised
+                    )
+                else:
+                    sub_widget.setFrameStyle(
+                        QFrame.Shape.Panel | QFrame.Shadow.Sunken
+                    )
+                    sub_widget.setEnabled(False)
+                sub_widget.setLineWidth(4)
+
+                # add the sub-board to the board layout
+                self.board_layout.addWidget(sub_widget, sy, sx)
+
+        return
+
+    def draw_qubic_board(self) -> None:
+        '''
+        Draws the layers of a 3D Noughts & Crosses board side by side
+        into the board's layout.
+        '''
+
+        for z in range(4):
+            # create a frame to hold the layer
+            layer_widget = QFrame()
+            layer_layout = QGridLayout()
+
+            # add the tiles of the layer, using their position with the
+            # layers side by side
+            for x in range(4):
+                for y in range(4):
+                    pos = (z*4 + x, y)
+                    layer_layout.addWidget(
+                        self.draw_tile(self.GameObj.board.cell(pos), pos, 48),
+                        y,
+                        x
+                    )
+
+            layer_widget.setLayout(layer_layout)
+
+            # style the layer
+            layer_widget.setFrameStyle(
+                QFrame.Shape.Panel | QFrame.Shadow.Raised
+            )
+            layer_widget.setLineWidth(4)
+
+            # add the layer to the board layout
+            self.board_layout.addWidget(layer_widget, 0, z)
+
+        return
+
     def inform_win(self, win_state: str) -> True | False:
         '''
         Creates a dialog window to inform the user of who has won or if
@@ -299,9 +413,18 @@ def main() -> None:
     Controls the main program flow.
     '''
 
+    # the gametype can be passed as the first argument, eg `ult`
+    # future: landing screen
+    parser = argparse.ArgumentParser(description='Noughts & Crosses Qt6')
+    parser.add_argument(
+        'gametype', nargs='?', default='cpu',
+        choices=Game(None).GAMETYPES.keys()
+    )
+    gametype = parser.parse_args().gametype
+
     # creates the window
     AppObj = QApplication([])
-    WindowObj = GUI_Interface(AppObj)
+    WindowObj = GUI_Interface(AppObj, gametype)
     WindowObj.show()
 
     # hands control of the program flow over to PyQt
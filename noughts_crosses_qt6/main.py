@@ -18,6 +18,9 @@ __credits__ = ['Max Harrison']
 
 from typing import Literal
 
+from qubic import QubicBoard
+from ultimate import UltimateBoard
+
 
 class Game:
     '''
@@ -61,33 +64,76 @@ class Game:
                     'id': 2,
                     'score': 0
                 }
+            ],
+            'ult': [
+                {
+                    'name': 'Player1',
+                    'type': 'player_turn',
+                    'id': 1,
+                    'score': 0
+                },
+                {
+                    'name': 'CPU1',
+                    'type': 'cpu_turn',
+                    'id': 2,
+                    'score': 0
+                }
+            ],
+            '3d': [
+                {
+                    'name': 'Player1',
+                    'type': 'player_turn',
+                    'id': 1,
+                    'score': 0
+                },
+                {
+                    'name': 'CPU1',
+                    'type': 'cpu_turn',
+                    'id': 2,
+                    'score': 0
+                }
             ]
         }
 
+        # setup the board classes for gametypes that don't use the
+        # standard 3x3 board
+        self.VARIANTS = {
+            'ult': UltimateBoard,
+            '3d': QubicBoard
+        }
+
         return
 
-    def setup_game(self, gametype: Literal['cpu', '2pl'] = None) -> None:
+    def setup_game(
+            self,
+            gametype: Literal['cpu', '2pl', 'ult', '3d'] = None
+        ) -> None:
         '''
         Sets the default variables for the game.
         '''
-        
-        # define a blank board (this must be 3x3)
-        # a value of 0 represents a blank tile
-        # a non-zero value represents the player indexed by `GAMETYPES`
-        self.board = [
-            [0, 0, 0],
-            [0, 0, 0],
-            [0, 0, 0]
-        ]
-
-        # reset the cpu move tracker
-        self.cpu_moves = list()
 
         # reset current game settings
         if gametype:
+            self.current_gametype = gametype
             self.current_game = self.GAMETYPES[gametype]
         self.current_player = 1
 
+        if self.current_gametype in self.VARIANTS:
+            # variants keep their own board state
+            self.board = self.VARIANTS[self.current_gametype]()
+        else:
+            # define a blank board (this must be 3x3)
+            # a value of 0 represents a blank tile
+            # a non-zero value represents the player indexed by `GAMETYPES`
+            self.board = [
+                [0, 0, 0],
+                [0, 0, 0],
+                [0, 0, 0]
+            ]
+
+        # reset the cpu move tracker
+        self.cpu_moves = list()
+
         return
 
     def take_turn(self, pos: tuple[int,int] = None) -> None:
@@ -104,9 +150,9 @@ class Game:
             match self.current_game[self.current_player - 1]['type']:
                 case 'player_turn':
                     # check if selected tile is empty
-                    if self.board[pos[1]][pos[0]] == 0:
+                    if self.is_free(pos):
                         # update board
-                        self.board[pos[1]][pos[0]] = self.current_player
+                        self.place(pos)
                         # redraw board
                         self.InterfaceObj.draw_board()
                     else:
@@ -142,6 +188,8 @@ class Game:
                 else:
                     # if they wish to exit
                     self.InterfaceObj._quit()  # future: landing screen
+                    # don't let the cpu take a turn on the finished board
+                    break
             else:
                 # next player
                 self.current_player += 1
@@ -162,6 +210,28 @@ class Game:
                     
         return
 
+    def is_free(self, pos: tuple[int, int]) -> bool:
+        '''
+        Checks if the tile at `pos` can be played in.
+        '''
+
+        if self.current_gametype in self.VARIANTS:
+            return self.board.is_free(pos)
+
+        return self.board[pos[1]][pos[0]] == 0
+
+    def place(self, pos: tuple[int, int]) -> None:
+        '''
+        Places the current player in the tile at `pos`.
+        '''
+
+        if self.current_gametype in self.VARIANTS:
+            self.board.place(pos, self.current_player)
+        else:
+            self.board[pos[1]][pos[0]] = self.current_player
+
+        return
+
     def cpu_turn(self) -> None:
         '''
         Takes a go as the cpu 'player'.
@@ -170,8 +240,14 @@ class Game:
         Peter W McOwan's logic on p137 of their book 'The Power of
         Computational Thinking' provided on www dot advanced-ict dot
         info. Links to the source can be found in the project README.
+
+        Variants use the search provided by their board class instead.
         '''
 
+        if self.current_gametype in self.VARIANTS:
+            self.place(self.board.cpu_move(self.current_player))
+            return
+
         def check_almost_win(id: int) -> tuple[int, int] | None:
             '''
             Checks if the player one move away from winning.
@@ -327,6 +403,9 @@ class Game:
         Checks if a player has made a winning move.
         '''
 
+        if self.current_gametype in self.VARIANTS:
+            return self.board.check_win(self.current_player)
+
         # check for horizontal wins
         for row in self.board:
             for tile in row:
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+
+'''
+# Noughts & Crosses Project (PyQt6) - 3D Noughts & Crosses (Qubic)
+'''
+
+__version__ = '1.0.0'
+__author__ = 'Cornelius-Figgle'
+__email__ = 'max@fullimage.net'
+__maintainer__ = 'Cornelius-Figgle'
+__copyright__ = 'Copyright (c) 2024 Max Harrison'
+__license__ = 'MIT'
+__status__ = 'Development'
+__credits__ = ['Max Harrison']
+
+# source code: https://github.com/Cornelius-Figgle/noughts-crosses-qt6
+
+
+from itertools import product
+
+from search import SearchBoard
+
+
+# the board is 4 layers of 4x4 tiles, with cell
+# `z*SIZE*SIZE + y*SIZE + x` representing the tile at `(x, y)` on
+# layer `z`
+SIZE = 4
+LAYER = SIZE ** 2
+CELLS = SIZE ** 3
+
+
+def _find_lines() -> tuple[tuple[int, ...], ...]:
+    '''
+    Finds the 76 winning lines of the board as tuples of cells.
+    '''
+
+    lines = set()
+
+    # walk from every cell in every direction, keeping the walks that
+    # stay on the board for all 4 tiles
+    for start in product(range(SIZE), repeat=3):
+        for step in product((-1, 0, 1), repeat=3):
+            if step == (0, 0, 0):
+                continue
+
+            line = list()
+            for i in range(SIZE):
+                x, y, z = (start[n] + step[n]*i for n in range(3))
+                if not (0 <= x < SIZE and 0 <= y < SIZE and 0 <= z < SIZE):
+                    break
+                line.append(z*LAYER + y*SIZE + x)
+            else:
+                # each line is found from both ends, so store it sorted
+                lines.add(tuple(sorted(line)))
+
+    return tuple(sorted(lines))
+
+
+# the 76 winning lines (48 straight, 24 diagonal across a plane and 4
+# diagonal through the cube)
+LINES = _find_lines()
+
+# index of the lines that pass through each cell, so a move only has
+# to look at its own lines (7 for corners/centre cells, else 4)
+CELL_LINES = tuple(
+    tuple(index for index, line in enumerate(LINES) if cell in line)
+    for cell in range(CELLS)
+)
+
+# weights used by the cpu to score a line it has 0-4 tiles in
+# (assuming the opponent has no tiles in that line)
+LINE_WEIGHTS = (0, 1, 4, 32, 256)
+
+# number of the most promising moves the cpu searches at each step
+SEARCH_WIDTH = 10
+
+
+class QubicBoard(SearchBoard):
+    '''
+    Board state and cpu logic for 3D Noughts & Crosses (Qubic).
+
+    The board is 4 stacked 4x4 layers, and a player wins by getting 4
+    tiles in a line in any direction, including through the layers.
+
+    Positions are passed in as `(x, y)` with the layers laid out side
+    by side, so the layer is `x // 4` and the tile within it is
+    `(x % 4, y)`.
+    '''
+
+    def __init__(self) -> None:
+        '''
+        Initialises a blank board.
+        '''
+
+        super().__init__()
+
+        # a value of 0 represents a blank tile
+        # a non-zero value represents the player in that tile
+        self.cells = [0] * CELLS
+
+        # number of tiles each player has in each line, indexed by
+        # `id - 1` then by line
+        self.counts = [[0] * len(LINES), [0] * len(LINES)]
+
+        # heuristic score of the board from player 1's view, kept up to
+        # date as tiles are placed so the cpu doesn't need to rescan
+        self.score = 0
+
+        # blank cells that would win the game for each player, kept up
+        # to date as tiles are placed so the cpu can find threats
+        # without scanning every line
+        self.wins = [set(), set()]
+
+        # id of the player that has won, 0 if nobody has
+        self.winner = 0
+
+        return
+
+    def cell(self, pos: tuple[int, int]) -> int:
+        '''
+        Returns the id of the player in the tile at `pos`, or 0 if it
+        is blank.
+        '''
+
+        return self.cells[self._move(pos)]
+
+    def is_free(self, pos: tuple[int, int]) -> bool:
+        '''
+        Checks if a move can legally be made at `pos`.
+        '''
+
+        return self.cells[self._move(pos)] == 0
+
+    def undo(self) -> None:
+        '''
+        Reverts the last move made, taking its tiles back out of the
+        line counters.
+        '''
+
+        cell, id, score, wins, winner = self.history.pop()
+
+        self.cells[cell] = 0
+        for line in CELL_LINES[cell]:
+            self.counts[id - 1][line] -= 1
+        self.score = score
+        self.wins = wins
+        self.winner = winner
+
+        return
+
+    def threats(self, id: int) -> list[int]:
+        '''
+        Lists the blank cells that would win the game for player `id`.
+        '''
+
+        return list(self.wins[id - 1])
+
+    def _move(self, pos: tuple[int, int]) -> int:
+        '''
+        Converts a position with the layers side by side into a cell.
+        '''
+
+        return (pos[0] // SIZE)*LAYER + pos[1]*SIZE + pos[0] % SIZE
+
+    def _position(self, cell: int) -> tuple[int, int]:
+        '''
+        Converts a cell back into a position with the layers side by
+        side.
+        '''
+
+        z, rest = divmod(cell, LAYER)
+        y, x = divmod(rest, SIZE)
+
+        return (z*SIZE + x, y)
+
+    def _play(self, cell: int, id: int) -> None:
+        '''
+        Places player `id` in `cell` and updates the line counters,
+        score and winner for the lines through that cell.
+        '''
+
+        # save the state needed to undo this move
+        self.history.append(
+            (
+                cell,
+                id,
+                self.score,
+                [self.wins[0].copy(), self.wins[1].copy()],
+                self.winner
+            )
+        )
+
+        self.cells[cell] = id
+
+        # the cell is no longer blank, so it can't be a winning cell for
+        # either player (this also covers filling or blocking a line
+        # with 3 tiles in, since this was its only blank cell)
+        self.wins[0].discard(cell)
+        self.wins[1].discard(cell)
+
+        own, opp = self.counts[id - 1], self.counts[2 - id]
+        sign = 1 if id == 1 else -1
+
+        for line in CELL_LINES[cell]:
+            # update what the line is worth after the move
+            if opp[line] == 0:
+                # the line gets better for us
+                self.score += sign * (
+                    LINE_WEIGHTS[own[line] + 1] - LINE_WEIGHTS[own[line]]
+                )
+                if own[line] == SIZE - 2:
+                    # the line's last blank cell becomes a winning cell
+                    for blank in LINES[line]:
+                        if self.cells[blank] == 0:
+                            self.wins[id - 1].add(blank)
+            elif own[line] == 0:
+                # the opponent can no longer win this line
+                self.score += sign * LINE_WEIGHTS[opp[line]]
+
+            own[line] += 1
+            if own[line] == SIZE:
+                self.winner = id
+
+        return
+
+    def _has_won(self, id: int) -> bool:
+        '''
+        Checks if player `id` has 4 tiles in a line.
+        '''
+
+        return self.winner == id
+
+    def _is_full(self) -> bool:
+        '''
+        Checks if every tile has been filled.
+        '''
+
+        return len(self.history) == CELLS
+
+    def _candidates(self, id: int) -> list[int]:
+        '''
+        Lists the `SEARCH_WIDTH` moves most worth searching for player
+        `id`, best first.
+        '''
+
+        # always take a winning move
+        wins = self.threats(id)
+        if wins:
+            return wins[:1]
+
+        # always block the opponent's winning move(s), there is no
+        # point searching anything else
+        blocks = self.threats(3 - id)
+        if blocks:
+            return blocks
+
+        own, opp = self.counts[id - 1], self.counts[2 - id]
+
+        def priority(cell: int) -> int:
+            # value of a cell is how much it helps our open lines plus
+            # how much it hurts the opponent's open lines
+            value = 0
+            for line in CELL_LINES[cell]:
+                if opp[line] == 0:
+                    value += LINE_WEIGHTS[own[line] + 1]
+                elif own[line] == 0:
+                    value += LINE_WEIGHTS[opp[line]]
+            return value
+
+        moves = [cell for cell in range(CELLS) if self.cells[cell] == 0]
+        moves.sort(key=priority, reverse=True)
+
+        return moves[:SEARCH_WIDTH]
+
+    def _evaluate(self, id: int) -> int:
+        '''
+        Heuristic score of the board from the view of player `id`.
+        '''
+
+        return self.score if id == 1 else -self.score
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+'''
+# Noughts & Crosses Project (PyQt6) - CPU Search
+'''
+
+__version__ = '1.0.0'
+__author__ = 'Cornelius-Figgle'
+__email__ = 'max@fullimage.net'
+__maintainer__ = 'Cornelius-Figgle'
+__copyright__ = 'Copyright (c) 2024 Max Harrison'
+__license__ = 'MIT'
+__status__ = 'Development'
+__credits__ = ['Max Harrison']
+
+# source code: https://github.com/Cornelius-Figgle/noughts-crosses-qt6
+
+
+from typing import Any, Literal
+
+
+# score given to a won game, must be larger than any heuristic score
+WIN_SCORE = 100_000
+
+# bound for the alpha-beta search, larger than any score
+INFINITY = 2 * WIN_SCORE
+
+
+class SearchBoard:
+    '''
+    Turn flow and cpu search shared by the board classes of variant
+    gametypes.
+
+    Each board class keeps its own state and provides:
+    - `_move(pos)` and `_position(move)` to convert between a position
+      from `Game` and its own representation of a move
+    - `_play(move, id)` and `undo()` to make and revert a move
+    - `_candidates(id)` to list the moves worth searching, best first
+    - `_has_won(id)` and `_is_full()` to check if the game is over
+    - `_evaluate(id)` to score the board from player `id`'s view
+    '''
+
+    def __init__(self) -> None:
+        '''
+        Initialises the move history.
+        '''
+
+        # stack of moves so they can be undone during the cpu search
+        self.history = list()
+
+        return
+
+    def place(self, pos: tuple[int, int], id: int) -> None:
+        '''
+        Places player `id` in the tile at `pos`. The move is assumed to
+        have already been checked with `is_free()`.
+        '''
+
+        self._play(self._move(pos), id)
+
+        return
+
+    def check_win(self, id: int) -> Literal['none', 'win', 'draw']:
+        '''
+        Checks if player `id` has won the game.
+        '''
+
+        if self._has_won(id):
+            return 'win'
+
+        # check if the board is finished without a win (draw)
+        if self._is_full():
+            return 'draw'
+
+        return 'none'
+
+    def cpu_move(self, id: int, depth: int = 4) -> tuple[int, int]:
+        '''
+        Picks a move for player `id` using a depth-limited negamax
+        search with alpha-beta pruning.
+        '''
+
+        best_score = -INFINITY
+        best_move = None
+        alpha = -INFINITY
+
+        for move in self._candidates(id):
+            self._play(move, id)
+            score = -self._negamax(3 - id, depth - 1, -INFINITY, -alpha)
+            self.undo()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, score)
+
+        return self._position(best_move)
+
+    def _negamax(self, id: int, depth: int, alpha: int, beta: int) -> int:
+        '''
+        Scores the board from the view of player `id`, who is about to
+        move.
+        '''
+
+        # the previous player may have just won
+        if self._has_won(3 - id):
+            return -WIN_SCORE - depth
+        if self._is_full():
+            return 0
+        if depth == 0:
+            return self._evaluate(id)
+
+        for move in self._candidates(id):
+            self._play(move, id)
+            score = -self._negamax(3 - id, depth - 1, -beta, -alpha)
+            self.undo()
+
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+
+        return alpha
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+
+'''
+# Noughts & Crosses Project (PyQt6) - Soak Test
+'''
+
+__version__ = '1.0.0'
+__author__ = 'Cornelius-Figgle'
+__email__ = 'max@fullimage.net'
+__maintainer__ = 'Cornelius-Figgle'
+__copyright__ = 'Copyright (c) 2024 Max Harrison'
+__license__ = 'MIT'
+__status__ = 'Development'
+__credits__ = ['Max Harrison']
+
+# source code: https://github.com/Cornelius-Figgle/noughts-crosses-qt6
+
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+# run without a display unless told otherwise
+# (this must be set before the `QApplication` is created)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QObject, QtMsgType, qInstallMessageHandler
+from PyQt6.QtWidgets import QApplication
+
+from gui import GUI_Interface
+
+
+# size of the grid of positions `Game.take_turn()` accepts for each
+# gametype, as `(width, height)`
+GRID_SIZES = {
+    'cpu': (3, 3),
+    '2pl': (3, 3),
+    'ult': (9, 9),
+    '3d': (16, 4)
+}
+
+
+def message_handler(mode: QtMsgType, context: Any, message: str) -> None:
+    '''
+    Prints Qt's messages, except the offscreen platform's warning on
+    every redraw, which would bury the soak test's output.
+    '''
+
+    if message == 'This plugin does not support propagateSizeHints()':
+        return
+
+    print(message, file=sys.stderr)
+
+    return
+
+
+class Soak_Interface(GUI_Interface):
+    '''
+    The normal gui, but it answers its own dialogs and times each
+    redraw so that games can be played automatically.
+    '''
+
+    def __init__(self, _AppObj: type[QApplication], gametype: str) -> None:
+        '''
+        Sets up the gui with the soak test's counters.
+        '''
+
+        # these have to exist before the first `draw_board()`
+        self.games_played = 0
+        self.redraw_times = list()
+
+        super().__init__(_AppObj, gametype)
+
+        return
+
+    def _delay(self, length: int, func: Callable[[], Any]) -> None:
+        '''
+        Skips the cpu's delay, but still goes through a `QTimer`.
+        '''
+
+        super()._delay(0, func)
+
+        return
+
+    def draw_board(self) -> None:
+        '''
+        Draws the board and records how long it took to draw and paint.
+        '''
+
+        start = time.perf_counter()
+        super().draw_board()
+        self.repaint()
+        self.redraw_times.append(time.perf_counter() - start)
+
+        return
+
+    def inform_win(self, win_state: str) -> True | False:
+        '''
+        Counts the finished game and always plays again.
+        '''
+
+        self.games_played += 1
+
+        return True
+
+    def inform_invalid(self, op: str) -> None:
+        '''
+        The soak test only picks valid moves, so this should not happen.
+        '''
+
+        raise RuntimeError(f'Soak test made an invalid {op}.')
+
+
+def get_rss() -> float | None:
+    '''
+    Returns the resident memory of this process in MiB, or `None` if it
+    can't be found on this platform.
+    '''
+
+    # linux
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    # other unix (this is the peak rather than the current usage)
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak / 2**20  # bytes
+    return peak / 2**10  # KiB
+
+
+def take_sample(
+        AppObj: type[QApplication],
+        WindowObj: type[Soak_Interface]
+    ) -> dict[str, Any]:
+    '''
+    Measures the memory, widget/object counts and mean redraw time of
+    the window since the last sample.
+    '''
+
+    # count every live `QObject` in the process, not just the window's
+    # children, so that parentless objects such as `delay_timer` are
+    # included (after clearing out any that are only waiting on gc)
+    # the window's children are added in too, since the ones created by
+    # Qt itself aren't seen by gc
+    gc.collect()
+    objects = len(
+        {obj for obj in gc.get_objects() if isinstance(obj, QObject)}
+        | set(WindowObj.findChildren(QObject))
+    )
+
+    redraw_times = WindowObj.redraw_times
+    WindowObj.redraw_times = list()
+
+    return {
+        'games': WindowObj.games_played,
+        'rss': get_rss(),
+        'widgets': len(AppObj.allWidgets()),
+        'objects': objects,
+        'redraw': 1000 * sum(redraw_times) / max(len(redraw_times), 1)
+    }
+
+
+def check_limits(
+        baseline: dict[str, Any],
+        sample: dict[str, Any],
+        args: argparse.Namespace
+    ) -> list[str]:
+    '''
+    Compares a sample against the baseline and lists any limits that
+    have been passed.
+    '''
+
+    failures = list()
+
+    if baseline['rss'] is not None and sample['rss'] is not None:
+        growth = sample['rss'] - baseline['rss']
+        if growth > args.max_rss:
+            failures.append(
+                f'RSS grew by {growth:.1f} MiB (limit {args.max_rss} MiB)'
+            )
+
+    growth = sample['widgets'] - baseline['widgets']
+    if growth > args.max_widgets:
+        failures.append(
+            f'Widget count grew by {growth} (limit {args.max_widgets})'
+        )
+
+    growth = sample['objects'] - baseline['objects']
+    if growth > args.max_objects:
+        failures.append(
+            f'QObject count grew by {growth} (limit {args.max_objects})'
+        )
+
+    ratio = sample['redraw'] / max(baseline['redraw'], 1e-6)
+    if ratio > args.max_redraw:
+        failures.append(
+            f'Redraw time grew by {ratio:.1f}x (limit {args.max_redraw}x)'
+        )
+
+    return failures
+
+
+def main() -> int:
+    '''
+    Plays games through the gui until the target is reached or a limit
+    is passed. Returns 1 if a limit was passed, else 0.
+    '''
+
+    parser = argparse.ArgumentParser(
+        description='Soak test the gui by playing lots of random games.'
+    )
+    parser.add_argument(
+        '--gametype', choices=GRID_SIZES.keys(), default='cpu'
+    )
+    parser.add_argument(
+        '--games', type=int, default=2000,
+        help='number of games to play'
+    )
+    parser.add_argument(
+        '--interval', type=int, default=100,
+        help='number of games between samples'
+    )
+    parser.add_argument(
+        '--max-rss', type=float, default=50,
+        help='allowed RSS growth in MiB'
+    )
+    parser.add_argument(
+        '--max-widgets', type=int, default=0,
+        help='allowed growth in live widgets'
+    )
+    parser.add_argument(
+        '--max-objects', type=int, default=0,
+        help='allowed growth in live QObjects'
+    )
+    parser.add_argument(
+        '--max-redraw', type=float, default=2,
+        help='allowed growth in mean redraw time, as a ratio'
+    )
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    width, height = GRID_SIZES[args.gametype]
+
+    # hide the offscreen platform's warnings
+    qInstallMessageHandler(message_handler)
+
+    # creates the window
+    AppObj = QApplication([])
+    WindowObj = Soak_Interface(AppObj, args.gametype)
+    WindowObj.show()
+
+    baseline = None
+    next_sample = args.interval
+
+    print('games    rss (MiB)  widgets  objects  redraw (ms)')
+
+    while WindowObj.games_played < args.games:
+        # wait for the cpu's redraw to happen
+        while (hasattr(WindowObj, 'delay_timer')
+                and WindowObj.delay_timer.isActive()):
+            AppObj.processEvents()
+
+        # pick a random valid move and play it as if it was clicked
+        moves = [
+            (x, y)
+            for x in range(width)
+            for y in range(height)
+            if WindowObj.GameObj.is_free((x, y))
+        ]
+        WindowObj._event(WindowObj.GameObj.take_turn, [random.choice(moves)])
+
+        if WindowObj.games_played < next_sample:
+            continue
+        next_sample += args.interval
+
+        # samples are always taken on a fresh board, straight after a
+        # game has finished, so the widget counts can be compared
+        # let any deleted widgets/timers be cleaned up before measuring
+        AppObj.processEvents()
+
+        sample = take_sample(AppObj, WindowObj)
+        print(
+            f'{sample["games"]:<8} '
+            f'{sample["rss"] or 0:<10.1f} '
+            f'{sample["widgets"]:<8} '
+            f'{sample["objects"]:<8} '
+            f'{sample["redraw"]:.3f}'
+        )
+
+        # the first sample is taken once everything has warmed up, and
+        # every later sample is compared to it
+        if baseline is None:
+            baseline = sample
+            continue
+
+        failures = check_limits(baseline, sample, args)
+        if failures:
+            for failure in failures:
+                print(f'FAIL: {failure}')
+            return 1
+
+    print('PASS')
+
+    return 0
+
+
+# only execute if called directly
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print()
+        sys.exit()
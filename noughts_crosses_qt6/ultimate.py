@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+
+'''
+# Noughts & Crosses Project (PyQt6) - Ultimate Noughts & Crosses
+'''
+
+__version__ = '1.0.0'
+__author__ = 'Cornelius-Figgle'
+__email__ = 'max@fullimage.net'
+__maintainer__ = 'Cornelius-Figgle'
+__copyright__ = 'Copyright (c) 2024 Max Harrison'
+__license__ = 'MIT'
+__status__ = 'Development'
+__credits__ = ['Max Harrison']
+
+# source code: https://github.com/Cornelius-Figgle/noughts-crosses-qt6
+
+
+from search import SearchBoard
+
+
+# every tile of a 3x3 board is stored as one bit of a 9-bit mask, with
+# bit `y*3 + x` representing the tile at `(x, y)`
+FULL_MASK = 0b111_111_111
+
+# the 8 winning lines of a 3x3 board as masks
+LINES = (
+    # horizontal lines
+    0b000_000_111,
+    0b000_111_000,
+    0b111_000_000,
+    # vertical lines
+    0b001_001_001,
+    0b010_010_010,
+    0b100_100_100,
+    # diagonal lines (TL:BR, TR:BL)
+    0b100_010_001,
+    0b001_010_100
+)
+
+# lookup table of every possible 9-bit mask, `True` if the mask
+# contains at least one winning line
+WIN_TABLE = tuple(
+    any(mask & line == line for line in LINES)
+    for mask in range(1 << 9)
+)
+
+# weights used by the cpu to score a line it has 0, 1 or 2 tiles in
+# (assuming the opponent has no tiles in that line)
+LINE_WEIGHTS = (0, 1, 4)
+
+
+class UltimateBoard(SearchBoard):
+    '''
+    Board state and cpu logic for Ultimate Noughts & Crosses.
+
+    The board is a 3x3 grid of 3x3 sub-boards. The tile you pick within
+    a sub-board decides which sub-board your opponent has to play in
+    next, unless that sub-board is already won or full, in which case
+    they can play in any open sub-board. Winning three sub-boards in a
+    line wins the game.
+
+    Positions are passed in as `(x, y)` on the full 9x9 grid, so the
+    sub-board is `(x // 3, y // 3)` and the tile within it is
+    `(x % 3, y % 3)`.
+    '''
+
+    def __init__(self) -> None:
+        '''
+        Initialises a blank board.
+        '''
+
+        super().__init__()
+
+        # nine 9-bit masks per player, indexed by `id - 1` then by
+        # sub-board (`sy*3 + sx`)
+        self.boards = [[0] * 9, [0] * 9]
+
+        # masks of the sub-boards each player has won
+        self.macro = [0, 0]
+
+        # mask of the sub-boards that can no longer be played in
+        # (either won or full)
+        self.closed = 0
+
+        # the sub-board the next move has to be in, `None` means any
+        self.next_sub = None
+
+        return
+
+    def cell(self, pos: tuple[int, int]) -> int:
+        '''
+        Returns the id of the player in the tile at `pos`, or 0 if it
+        is blank.
+        '''
+
+        sub, bit = self._move(pos)
+
+        if self.boards[0][sub] & bit:
+            return 1
+        elif self.boards[1][sub] & bit:
+            return 2
+        else:
+            return 0
+
+    def sub_owner(self, sub: tuple[int, int]) -> int:
+        '''
+        Returns the id of the player that has won sub-board `sub`, or 0
+        if nobody has.
+        '''
+
+        bit = 1 << (sub[1]*3 + sub[0])
+
+        if self.macro[0] & bit:
+            return 1
+        elif self.macro[1] & bit:
+            return 2
+        else:
+            return 0
+
+    def is_active(self, sub: tuple[int, int]) -> bool:
+        '''
+        Checks if the next move can be made in sub-board `sub`.
+        '''
+
+        index = sub[1]*3 + sub[0]
+
+        if self.closed & (1 << index):
+            return False
+
+        return self.next_sub is None or self.next_sub == index
+
+    def is_free(self, pos: tuple[int, int]) -> bool:
+        '''
+        Checks if a move can legally be made at `pos`.
+        '''
+
+        sub, bit = self._move(pos)
+
+        if not self.is_active((sub % 3, sub // 3)):
+            return False
+
+        return not (self.boards[0][sub] | self.boards[1][sub]) & bit
+
+    def undo(self) -> None:
+        '''
+        Reverts the last move made, including any change to the
+        sub-boards it closed.
+        '''
+
+        sub, bit, id, next_sub, closed, macro = self.history.pop()
+
+        self.boards[id - 1][sub] &= ~bit
+        self.next_sub = next_sub
+        self.closed = closed
+        self.macro[id - 1] = macro
+
+        return
+
+    def _move(self, pos: tuple[int, int]) -> tuple[int, int]:
+        '''
+        Converts a position on the full grid into the index of its
+        sub-board and the bit of its tile within that sub-board.
+        '''
+
+        sub = (pos[1] // 3)*3 + pos[0] // 3
+        bit = 1 << ((pos[1] % 3)*3 + pos[0] % 3)
+
+        return sub, bit
+
+    def _position(self, move: tuple[int, int]) -> tuple[int, int]:
+        '''
+        Converts a sub-board and bit back into a position on the full
+        grid.
+        '''
+
+        sub, bit = move
+        index = bit.bit_length() - 1
+
+        return (
+            (sub % 3)*3 + index % 3,
+            (sub // 3)*3 + index // 3
+        )
+
+    def _play(self, move: tuple[int, int], id: int) -> None:
+        '''
+        Places player `id` at the `(sub, bit)` given by `move` and
+        updates the sub-board/next move state.
+        '''
+
+        sub, bit = move
+
+        # save the state needed to undo this move
+        self.history.append(
+            (sub, bit, id, self.next_sub, self.closed, self.macro[id - 1])
+        )
+
+        # place the tile
+        mask = self.boards[id - 1][sub] | bit
+        self.boards[id - 1][sub] = mask
+
+        # check if the sub-board has been won or filled
+        if WIN_TABLE[mask]:
+            self.macro[id - 1] |= 1 << sub
+            self.closed |= 1 << sub
+        elif mask | self.boards[2 - id][sub] == FULL_MASK:
+            self.closed |= 1 << sub
+
+        # the tile we picked decides the next sub-board, unless it has
+        # already been closed
+        index = bit.bit_length() - 1
+        if self.closed & (1 << index):
+            self.next_sub = None
+        else:
+            self.next_sub = index
+
+        return
+
+    def _moves(self) -> list[tuple[int, int]]:
+        '''
+        Lists every legal move as `(sub, bit)` pairs.
+        '''
+
+        if self.next_sub is None:
+            subs = [
+                sub for sub in range(9) if not self.closed & (1 << sub)
+            ]
+        else:
+            subs = [self.next_sub]
+
+        moves = list()
+        for sub in subs:
+            free = ~(self.boards[0][sub] | self.boards[1][sub]) & FULL_MASK
+            while free:
+                bit = free & -free
+                moves.append((sub, bit))
+                free ^= bit
+
+        return moves
+
+    def _has_won(self, id: int) -> bool:
+        '''
+        Checks if player `id` has won three sub-boards in a line.
+        '''
+
+        return WIN_TABLE[self.macro[id - 1]]
+
+    def _is_full(self) -> bool:
+        '''
+        Checks if every sub-board has been won or filled.
+        '''
+
+        return self.closed == FULL_MASK
+
+    def _candidates(self, id: int) -> list[tuple[int, int]]:
+        '''
+        Lists every legal move, with the moves most likely to be good
+        first so that alpha-beta can prune more of the search.
+        '''
+
+        own = self.boards[id - 1]
+
+        def priority(move: tuple[int, int]) -> int:
+            sub, bit = move
+            index = bit.bit_length() - 1
+
+            # moves that win a sub-board go first
+            if WIN_TABLE[own[sub] | bit]:
+                return 0
+            # moves that give the opponent a free choice go last
+            elif self.closed & (1 << index):
+                return 2
+            else:
+                return 1
+
+        return sorted(self._moves(), key=priority)
+
+    def _evaluate(self, id: int) -> int:
+        '''
+        Heuristic score of the board from the view of player `id`.
+        '''
+
+        own, opp = self.boards[id - 1], self.boards[2 - id]
+        score = 0
+
+        # score the open lines in every sub-board that is still open
+        for sub in range(9):
+            if self.closed & (1 << sub):
+                continue
+            score += _line_score(own[sub], opp[sub])
+            score -= _line_score(opp[sub], own[sub])
+
+        # won sub-boards, and lines of them, are worth a lot more
+        own_macro, opp_macro = self.macro[id - 1], self.macro[2 - id]
+        score += 10 * (own_macro.bit_count() - opp_macro.bit_count())
+        # (drawn sub-boards block lines for both players)
+        score += 20 * (
+            _line_score(own_macro, self.closed & ~own_macro)
+            - _line_score(opp_macro, self.closed & ~opp_macro)
+        )
+
+        return score
+
+
+def _line_score(own: int, opp: int) -> int:
+    '''
+    Sums `LINE_WEIGHTS` for each line that `own` could still win.
+    '''
+
+    score = 0
+    for line in LINES:
+        if not opp & line:
+            score += LINE_WEIGHTS[(own & line).bit_count()]
+
+    return score